@@ -4,123 +4,465 @@ PrairieLearn Manager (Niema Moshiri 2024)
 '''
 
 # standard imports
-from json import load as jload
-from os.path import isdir
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from os import O_RDONLY, close, fstat, open as os_open, read as os_read, scandir, stat
+from os.path import commonprefix, isdir, isfile, join
 from pathlib import Path
+from stat import S_ISREG
 from sys import argv, stderr
+from threading import Lock, Thread
 
 # useful constants
 VERSION = '0.0.1'
 DEFAULT_TITLE = "PrairieLearn Manager v%s" % VERSION
 ROOT_PATH = Path('/')
+MAX_IO_THREADS = 32
+JSON_CACHE_SIZE = 4096 # max number of files kept in JSON_CACHE
+JSON_CACHE = dict() # JSON file path string -> (mtime, size, loaded data) of the last version loaded by load_json_cached(), oldest first
+CACHE_MISS = object() # returned by peek functions (e.g. peek_json_cached()) for data that hasn't been loaded yet
+NAV_PAGE_SIZE = 200 # max number of folders shown per page in app_nav_course
+RADIOLIST_DIALOG = None # (app, dialog, label, body, current radio list) reused by run_radiolist_dialog(), built on first use
+COURSE_PATH_CACHE = dict() # folder path -> root course folder containing it (for every folder find_course_path() walked through)
+LISTING_CACHE = dict() # folder path -> (folder version, paths of course instances/questions/assessments found in it), shared by all views
+LISTING_PENDING = dict() # folder path -> (folder version, Future) of a listing currently being built (e.g. by a background prefetch), so other callers wait for it instead of walking again
+LISTING_LOCK = Lock() # guards LISTING_CACHE and LISTING_PENDING, which background prefetch threads also update
 
 # error message
 def error(s, file=stderr, retval=1):
     print("[ERROR] %s" % s, file=file); exit(retval)
 
-# import prompt_toolkit
+# import prompt_toolkit (only once the UI is needed, so e.g. printing the usage message doesn't pay for importing it)
+def import_prompt_toolkit():
+    global FormattedText, HTML, input_dialog, message_dialog
+    try:
+        from prompt_toolkit.formatted_text import FormattedText, HTML
+        from prompt_toolkit.shortcuts import input_dialog, message_dialog
+    except:
+        error("Unable to import 'prompt_toolkit'. Install via: 'pip install prompt_toolkit'")
+
+# build the dialog reused by every run_radiolist_dialog() call (the same layout as prompt_toolkit's radiolist_dialog), as an (app, dialog, label, body, current radio list) tuple
+# (the current radio list is held in a 1-element list, as each call swaps in a new one)
+def build_radiolist_dialog():
+    from prompt_toolkit.application import Application, get_app
+    from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
+    from prompt_toolkit.key_binding.bindings.focus import focus_next, focus_previous
+    from prompt_toolkit.key_binding.defaults import load_key_bindings
+    from prompt_toolkit.layout import HSplit, Layout
+    from prompt_toolkit.widgets import Button, Dialog, Label, RadioList
+    label = Label(text='', dont_extend_height=True); current = [RadioList(values=[(None, '')])]
+    body = HSplit([label, current[0]], padding=1)
+    buttons = [Button(text='Ok', handler=lambda: get_app().exit(result=current[0].current_value)), Button(text='Cancel', handler=lambda: get_app().exit())]
+    dialog = Dialog(title='', body=body, buttons=buttons, with_background=True)
+    bindings = KeyBindings(); bindings.add('tab')(focus_next); bindings.add('s-tab')(focus_previous)
+    app = Application(layout=Layout(dialog), key_bindings=merge_key_bindings([load_key_bindings(), bindings]), mouse_support=True, full_screen=True)
+    return app, dialog, label, body, current
+
+# run a radio list dialog and return the selected value (or None if cancelled)
+# (prompt_toolkit's radiolist_dialog builds a whole new Application with its key bindings every time, so instead build one once and swap in the title/text, a new RadioList of the values, and a new Layout)
+def run_radiolist_dialog(title='', text='', values=None):
+    global RADIOLIST_DIALOG
+    if RADIOLIST_DIALOG is None:
+        RADIOLIST_DIALOG = build_radiolist_dialog()
+    app, dialog, label, body, current = RADIOLIST_DIALOG
+    from prompt_toolkit.layout import Layout, to_container
+    from prompt_toolkit.widgets import RadioList
+    dialog.title = title; label.text = text
+    current[0] = RadioList(values=values); body.children[1] = to_container(current[0])
+    app.layout = Layout(dialog, focused_element=current[0]) # a fresh layout each time, as the old one's focus stack keeps every previous radio list alive
+    return app.run()
+
+# import a fast JSON parser if available (optional: orjson, then msgspec, then ujson, then fall back to the standard library)
 try:
-    from prompt_toolkit.formatted_text import HTML
-    from prompt_toolkit.shortcuts import input_dialog, message_dialog, radiolist_dialog
+    from orjson import loads as jloads
 except:
-    error("Unable to import 'prompt_toolkit'. Install via: 'pip install prompt_toolkit'")
+    try:
+        from msgspec.json import decode as jloads
+    except:
+        try:
+            from ujson import loads as jloads
+        except:
+            from json import loads as jloads
+
+# useful prompt_toolkit constants (labels are given as (style, text) fragment lists, which prompt_toolkit accepts anywhere HTML is, so they don't need prompt_toolkit to be imported yet)
+APP_EXIT_TUPLE = (False, [('class:ansired', '--- Exit Application ---')])
+APP_PREV_PAGE_TUPLE = ('__prev__', [('class:ansiyellow', '« Previous Page')])
+APP_NEXT_PAGE_TUPLE = ('__next__', [('class:ansiyellow', '» Next Page')])
+APP_PARENT_FOLDER_LABEL = [('class:ansiblue', '.. (Parent Folder)')]
+APP_SELECT_COURSE_TUPLE = ('.', [('class:ansigreen', '--- Select This Course ---')])
+APP_COURSE_HOME_VALUES = (
+    ('course_instances', [('class:ansigreen', 'View Course Instances')]),
+    ('questions', [('class:ansigreen', 'View Questions')]),
+    ('refresh', [('class:ansigreen', 'Refresh Course')]),
+    APP_EXIT_TUPLE,
+)
+APP_COURSE_INSTANCE_HOME_VALUES = (
+    ('access_controls', [('class:ansigreen', 'View Access Controls')]),
+    ('assessments', [('class:ansigreen', 'View Assessments')]),
+    APP_EXIT_TUPLE,
+)
+APP_ASSESSMENT_HOME_VALUES = (
+    ('zones', [('class:ansigreen', 'View Zones')]),
+    APP_EXIT_TUPLE,
+)
+APP_ZONE_HOME_VALUES = (
+    ('questions', [('class:ansigreen', 'View Questions')]),
+    APP_EXIT_TUPLE,
+)
+APP_QUESTION_HOME_VALUES = (
+    APP_EXIT_TUPLE,
+)
+
+# info file fields shown in each home view, as (key, display name) tuples
+COURSE_INFO_ORDER = (('uuid','UUID'), ('comment','Comment'), ('name','Name'), ('title','Title'))
+COURSE_INSTANCE_INFO_ORDER = (('uuid','UUID'), ('comment','Comment'), ('longName','Long Name'), ('hideInEnrollPage','Hide in Enroll Page'), ('timezone','Time Zone'))
+ASSESSMENT_INFO_ORDER = (('uuid','UUID'), ('comment','Comment'), ('type','Type'), ('set','Set'), ('number','Number'), ('title','Title'), ('shuffleQuestions','Shuffle Questions'), ('allowRealTimeGrading','Allow Real-Time Grading'))
+QUESTION_INFO_ORDER = (('uuid','UUID'), ('comment','Comment'), ('title','Title'))
+
+# parse an HTML label string once and reuse the parsed object across redraws
+@lru_cache(maxsize=4096)
+def cached_html(s):
+    return HTML(s)
+
+# parse a single-color HTML label once per (color, text) pair, with the text escaped so names containing e.g. '<' or '&' are shown as-is
+@lru_cache(maxsize=8192)
+def colored_html(color, s):
+    return HTML('<%s>{}</%s>' % (color, color)).format(s)
+
+# backtrack directions stored in align()'s DP matrix (one byte per cell)
+ALN_DIAG = 0  # match/mismatch: came from (i-1, j-1)
+ALN_GAP_S = 1 # gap in s: came from (i, j-1)
+ALN_GAP_T = 2 # gap in t: came from (i-1, j)
+ALN_STEPS = ((1,1), (0,1), (1,0)) # (di, dj) moved back by each direction, indexed by direction
+
+# align two strings without substitutions using bit-parallel LCS (Hyyro), where bit j of row i's bitvector is 1 iff LCS(s[:i], t[:j+1]) == LCS(s[:i], t[:j])
+# (gives the same result as align() whenever it only has to maximize the number of matched characters, using the same tie-breaking)
+def align_bitparallel(s, t):
+    # a common prefix always ends up matched (ties place gaps as late as possible), so trim it, which also handles s == t and one being a prefix of the other
+    p = len(commonprefix((s, t)))
+    if p == len(s):
+        return s + '-'*(len(t)-p), t
+    if p == len(t):
+        return s, t + '-'*(len(s)-p)
+    prefix = s[:p]; s = s[p:]; t = t[p:]
+
+    # compute the bitvector of every row, using Python ints as arbitrarily long bitvectors over t
+    m = len(s); n = len(t); full = (1 << n) - 1; peq = dict()
+    for j, c in enumerate(t):
+        peq[c] = peq.get(c, 0) | (1 << j)
+    rows = [full]; v = full
+    for c in s:
+        u = v & peq.get(c, 0); v = ((v + u) | (v - u)) & full; rows.append(v)
 
-# useful prompt_toolkit constants
-APP_EXIT_TUPLE = (False, HTML('<ansired>--- Exit Application ---</ansired>'))
+    # backtrack and return result (s_aln and t_aln need to be reversed before returning)
+    # (ties are broken like in the DP: gap in s if LCS(i,j-1) == LCS(i,j), else gap in t if LCS(i-1,j) == LCS(i,j), else match)
+    s_aln = list(); t_aln = list(); i = m; j = n
+    while i != 0 or j != 0:
+        if j != 0 and (rows[i] >> (j-1)) & 1:
+            s_aln.append('-'); t_aln.append(t[j-1]); j -= 1
+        elif i != 0 and (j == 0 or bin(rows[i-1] & ((1 << j) - 1)).count('1') == bin(rows[i] & ((1 << j) - 1)).count('1')):
+            s_aln.append(s[i-1]); t_aln.append('-'); i -= 1
+        else:
+            s_aln.append(s[i-1]); t_aln.append(t[j-1]); i -= 1; j -= 1
+    return prefix + ''.join(s_aln)[::-1], prefix + ''.join(t_aln)[::-1]
 
 # align two strings using Needleman-Wunsch
 def align(s, t, match_score=1, mismatch_penalty=float('-inf'), gap_penalty=-1):
     # set things up, e.g. convert s and t to strings if not already
-    diag = {True:match_score, False:mismatch_penalty} # diag[s[i] == t[j]] gets you the match score / mismatch penalty
     if not isinstance(s, str):
         s = str(s)
     if not isinstance(t, str):
         t = str(t)
-
-    # perform DP, where cells are (score, i, j) tuples (or None if not yet calculated)
-    dp = [[None for j in range(len(t)+1)] for i in range(len(s)+1)]
-    dp[0][0] = (0, None, None)
-    for i in range(len(s)):
-        dp[i+1][0] = (gap_penalty * (i+1), i, 0)
-    for j in range(len(t)):
-        dp[0][j+1] = (gap_penalty * (j+1), 0, j)
-    for i in range(len(s)):
-        for j in range(len(t)):
-            dp[i+1][j+1] = max((
-                (dp[i][j][0] + diag[s[i] == t[j]], i, j), # match/mismatch
-                (dp[i+1][j][0] + gap_penalty, i+1, j),    # gap in s
-                (dp[i][j+1][0] + gap_penalty, i, j+1),    # gap in t
-            ))
+    m = len(s); n = len(t)
+
+    # if substitutions are forbidden (the default) and matching more characters always scores better, skip the full DP
+    # (only for integer scores, so there's no floating-point rounding that could break ties differently than the DP)
+    if mismatch_penalty == float('-inf') and match_score - 2*gap_penalty > 0 and float(match_score).is_integer() and float(gap_penalty).is_integer():
+        return align_bitparallel(s, t)
+
+    # perform DP row by row, only keeping the previous and current rows of scores and storing backtrack directions in one bytearray per row
+    # (ties are broken gap in s > gap in t > match/mismatch)
+    bt = [bytearray(n+1) for i in range(m+1)]
+    bt[0][1:] = bytes([ALN_GAP_S]) * n
+    # (the inner loop walks t and the previous row in lockstep and keeps the cell to the left in a local, so it only does scalar work per cell)
+    prev = [gap_penalty * j for j in range(n+1)]
+    for i in range(1, m+1):
+        s_char = s[i-1]; left = gap_penalty * i; curr = [left]; bt_row = bt[i]; bt_row[0] = ALN_GAP_T
+        for j, t_char, up_left, up in zip(range(1, n+1), t, prev, islice(prev, 1, None)):
+            diag_score = up_left + (match_score if s_char == t_char else mismatch_penalty)
+            gap_s_score = left + gap_penalty
+            gap_t_score = up + gap_penalty
+            if gap_s_score >= gap_t_score and gap_s_score >= diag_score:
+                left = gap_s_score; bt_row[j] = ALN_GAP_S
+            elif gap_t_score >= diag_score:
+                left = gap_t_score; bt_row[j] = ALN_GAP_T
+            else:
+                left = diag_score # bt_row[j] is already ALN_DIAG
+            curr.append(left)
+        prev = curr
 
     # backtrack and return result (s_aln and t_aln need to be reversed before returning)
-    s_aln = list(); t_aln = list(); i = len(s); j = len(t)
-    while True:
-        if i == 0 and j == 0:
-            break
-        if dp[i][j][1] == i:
-            s_aln.append('-')
-        else:
-            s_aln.append(s[i-1])
-        if dp[i][j][2] == j:
-            t_aln.append('-')
-        else:
-            t_aln.append(t[j-1])
-        DUMMY, i, j = dp[i][j]
+    # (each step is decoded from ALN_STEPS without branching: index 0 of the '-'-prefixed strings is the gap character, which is picked when di/dj is 0)
+    s_gap = '-' + s; t_gap = '-' + t
+    s_aln = list(); t_aln = list(); i = m; j = n
+    while i != 0 or j != 0:
+        di, dj = ALN_STEPS[bt[i][j]]
+        s_aln.append(s_gap[i*di]); t_aln.append(t_gap[j*dj]); i -= di; j -= dj
     return ''.join(s_aln)[::-1], ''.join(t_aln)[::-1]
 
-# find the root course folder given a subfolder
+# check if a folder (given as a string path) contains an 'infoCourse.json' file with a single stat() call
+def has_info_course(dir_path):
+    try:
+        return S_ISREG(stat(join(dir_path, 'infoCourse.json')).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+# get the mtime of a path (or None if it doesn't exist), e.g. to check if a folder's listing needs to be refreshed
+def get_mtime(path):
+    try:
+        return stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+# iterate over the folders under a root folder (recursively, skipping hidden folders and symlinks to folders) that contain a file with a given name
+# (PrairieLearn questions/assessments can't be nested, so the walk doesn't descend into a folder that contains the file, e.g. a question's 'tests' or 'clientFilesQuestion')
+def iter_folders_containing(root, filename):
+    stack = [str(root)]
+    while len(stack) != 0:
+        curr = stack.pop()
+        try:
+            with scandir(curr) as it:
+                entries = list(it)
+        except OSError:
+            continue # skip folders that don't exist or that we don't have access to
+        subfolders = list(); found = False
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith('.'):
+                    subfolders.append(entry.path)
+            elif entry.name == filename and entry.is_file():
+                found = True
+        if found:
+            yield Path(curr)
+        else:
+            stack += subfolders
+
+# get the mtimes of a folder and of its immediate subfolders (or None if it doesn't exist), which changes whenever an entry is added/removed/renamed in any of them
+# (cheaper than walking the whole tree, and catches e.g. a new question in 'questions/<topic>/')
+def get_rollup_mtime(path):
+    try:
+        with scandir(path) as it:
+            return (stat(path).st_mtime_ns,) + tuple(entry.stat(follow_symlinks=False).st_mtime_ns for entry in it if entry.is_dir(follow_symlinks=False))
+    except FileNotFoundError:
+        return None
+
+# get the paths found by list_func() in a folder, reusing the last listing if the folder's version (from version_func) is unchanged since then
+# (changes deeper than version_func looks don't invalidate the listing, so PLCourse.refresh() drops a course's listings to pick those up)
+# (if another thread is already building the same version of the listing, wait for its result instead of walking the folder again)
+def get_listing(folder, list_func, version_func=get_mtime):
+    version = version_func(folder)
+    with LISTING_LOCK:
+        cached = LISTING_CACHE.get(folder)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        pending = LISTING_PENDING.get(folder)
+        if pending is not None and pending[0] == version:
+            future = pending[1]; owner = False
+        else:
+            future = Future(); owner = True; pending = LISTING_PENDING[folder] = (version, future)
+    if not owner:
+        return future.result()
+    try:
+        paths = list(list_func())
+    except BaseException as e:
+        with LISTING_LOCK:
+            if LISTING_PENDING.get(folder) is pending:
+                del LISTING_PENDING[folder]
+        future.set_exception(e); raise
+    with LISTING_LOCK:
+        if LISTING_PENDING.get(folder) is pending: # only cache it if PLCourse.refresh() didn't drop it while it was being built
+            del LISTING_PENDING[folder]; LISTING_CACHE[folder] = (version, paths)
+    future.set_result(paths)
+    return paths
+
+# run a function in a daemon background thread (so exiting never waits for it), ignoring its errors (e.g. prefetching, where the view that needs the same data reports them itself)
+def run_in_background(func):
+    def target():
+        try:
+            func()
+        except Exception:
+            pass
+    Thread(target=target, daemon=True).start()
+
+# read the raw bytes of a file with os.open()/os.read() (no buffered file object), given its size from an earlier stat() if known
+# (reads one byte more than the expected size, so a file that grew since the stat() is still read fully, and an unchanged file takes a single read)
+def read_bytes(path, size=None):
+    fd = os_open(path, O_RDONLY)
+    try:
+        if size is None:
+            size = fstat(fd).st_size
+        data = os_read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while len(chunks[-1]) != 0:
+            chunks.append(os_read(fd, 65536))
+        return b''.join(chunks)
+    finally:
+        close(fd)
+
+# load and return the data from a JSON file
+def load_json(path, size=None):
+    return jloads(read_bytes(path, size))
+
+# return the data from a JSON file if load_json_cached() already loaded its current version (one stat() per call), else CACHE_MISS
+def peek_json_cached(path):
+    path = str(path); st = stat(path); cached = JSON_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    return CACHE_MISS
+
+# load and return the data from a JSON file, reusing the previously-parsed data if the file wasn't modified since (one stat() per call)
+# the returned data is shared between callers, so it must not be modified (it's the same object until the file changes, so e.g. the home views only rebuild their text when it isn't)
+def load_json_cached(path):
+    path = str(path); st = stat(path); cached = JSON_CACHE.get(path)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        cached = (st.st_mtime_ns, st.st_size, load_json(path, st.st_size))
+        JSON_CACHE.pop(path, None); JSON_CACHE[path] = cached
+        if len(JSON_CACHE) > JSON_CACHE_SIZE:
+            JSON_CACHE.pop(next(iter(JSON_CACHE)), None)
+    return cached[2]
+
+# run an I/O-bound load function (e.g. JSON file loading) on multiple items in parallel (returns a dict mapping each item to its loaded data)
+# (peek gives an item's data if it's already loaded, else CACHE_MISS, so only the misses go to a thread pool and a redraw with warm caches stays serial)
+def load_parallel(func, items, peek=None):
+    data = dict(); misses = list()
+    for item in items:
+        data[item] = CACHE_MISS if peek is None else peek(item)
+        if data[item] is CACHE_MISS:
+            misses.append(item)
+    if len(misses) == 1:
+        data[misses[0]] = func(misses[0])
+    elif len(misses) != 0:
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_THREADS, len(misses))) as executor:
+            data.update(zip(misses, executor.map(func, misses)))
+    return data
+
+# load the info file (named info_filename) of every item listed in a folder by get_listing() (returns a dict mapping each item's path to its loaded data)
+# (if an item's info file was deleted since the listing was built, e.g. without changing the folder's version, the item is dropped along with the stale listing)
+def load_listing(folder, list_func, info_filename, version_func=get_mtime):
+    def load(p, func=load_json_cached):
+        try:
+            return func(p / info_filename)
+        except FileNotFoundError:
+            return None
+    data = load_parallel(load, get_listing(folder, list_func, version_func), lambda p: load(p, peek_json_cached))
+    if None in data.values():
+        with LISTING_LOCK:
+            LISTING_CACHE.pop(folder, None)
+        data = {p: d for p, d in data.items() if d is not None}
+    return data
+
+# find the root course folder given a subfolder (cached for every folder walked through, as e.g. every zone of every assessment shares the same ancestors)
 def find_course_path(orig_path):
-    curr_path = orig_path
+    curr_path = orig_path; walked = list()
     while curr_path != ROOT_PATH:
-        if (curr_path / 'infoCourse.json').is_file():
-            return curr_path
-        curr_path = curr_path.parent
+        course_path = COURSE_PATH_CACHE.get(curr_path)
+        if course_path is None and has_info_course(str(curr_path)):
+            course_path = curr_path
+        if course_path is not None:
+            for p in walked:
+                COURSE_PATH_CACHE[p] = course_path
+            return course_path
+        walked.append(curr_path); curr_path = curr_path.parent
     error("Unable to find root course folder: %s" % orig_path)
 
+# get the radio list values of a list view from (value, HTML label string) pairs, sorted by label (casefolded once per label, not per comparison) and followed by the exit option
+def sorted_label_values(labels):
+    rows = [(label.casefold(), value, label) for value, label in labels]; rows.sort(key=itemgetter(0))
+    values = [(value, cached_html(label)) for _, value, label in rows]
+    values.append(APP_EXIT_TUPLE)
+    return values
+
 # app: welcome message
 def app_welcome():
     text = HTML("Welcome to <ansiblue>PrairieLearn Manager v%s</ansiblue>!\n\n<ansigreen>Niema Moshiri 2024</ansigreen>" % VERSION)
     message_dialog(title=DEFAULT_TITLE, text=text).run()
 
+# list the children folders of a folder as sorted (name, path string) pairs (the folder's mtime is only part of the cache key, so adding/removing children invalidates it)
+# (scandir's cached entry type avoids a stat() per child, and non-folders are dropped before sorting)
+@lru_cache(maxsize=256)
+def list_nav_children(path, mtime, show_hidden):
+    with scandir(path) as it:
+        entries = [(entry.name.strip().casefold(), entry.name, entry.path) for entry in it if entry.is_dir() and (show_hidden or not entry.name.startswith('.'))]
+    entries.sort(key=itemgetter(0))
+    return tuple((name, child_path) for sort_key, name, child_path in entries)
+
+# get the app_nav_course values of children folders given as (name, path string) pairs, with courses shown in green
+# (probed on every call rather than cached with the listing, as creating 'infoCourse.json' in a child doesn't change this folder's mtime)
+def nav_children_values(children):
+    values = list()
+    for name, child_path in children:
+        try:
+            if has_info_course(child_path):
+                values.append((Path(child_path), colored_html('ansigreen', name)))
+            else:
+                values.append((Path(child_path), name))
+        except OSError:
+            continue # skip folders we don't have access to (e.g. PermissionError from stat())
+    return values
+
 # app: navigate to find PrairieLearn course
 def app_nav_course(curr_path=Path.cwd(), title=DEFAULT_TITLE, show_hidden=False):
+    page_idx = 0 # only NAV_PAGE_SIZE children are shown at a time to keep huge folders responsive
     while True:
-        # set things up
-        text = HTML("<ansired>Current Path: %s</ansired>" % curr_path)
-        values = list()
+        # set things up (options shown above and below the children of this path)
+        head = list(); tail = list()
 
         # Add "Go to Parent" option if the current path is not the root of the filesystem
         if curr_path != ROOT_PATH:
-            values.append((curr_path.parent, HTML("<ansiblue>.. (Parent Folder)</ansiblue>")))
+            head.append((curr_path.parent, APP_PARENT_FOLDER_LABEL))
 
         # Add "Select This Course" if this is a PL course
-        if (curr_path / 'infoCourse.json').is_file():
-            values.append(('.', HTML("<ansigreen>--- Select This Course ---</ansigreen>")))
-
-        # add all children of this path
-        for child in sorted(curr_path.iterdir(), key=lambda x: x.name.strip().lower()):
-            if child.is_dir() and (show_hidden or child.name[0] != '.'):
-                try:
-                    if (child / 'infoCourse.json').is_file():
-                        values.append((child, HTML("<ansigreen>%s</ansigreen>" % child.name)))
-                    else:
-                        values.append((child, child.name))
-                except:
-                    continue # skip folders we don't have access to
+        if has_info_course(str(curr_path)):
+            head.append(APP_SELECT_COURSE_TUPLE)
+
+        # add all children of this path (revisiting an unmodified folder, even from a later app_nav_course call, reuses its last scan)
+        children = list_nav_children(curr_path, stat(curr_path).st_mtime_ns, show_hidden)
+
+        # only add the children in the current page (with previous/next page options if needed)
+        num_pages = max(1, (len(children) + NAV_PAGE_SIZE - 1) // NAV_PAGE_SIZE)
+        page_idx = min(page_idx, num_pages - 1)
+        if page_idx > 0:
+            head.append(APP_PREV_PAGE_TUPLE)
+        if page_idx < num_pages - 1:
+            tail.append(APP_NEXT_PAGE_TUPLE)
 
         # add "Exit" option
-        values.append(APP_EXIT_TUPLE)
+        tail.append(APP_EXIT_TUPLE)
+
+        # build the values list with a single sized allocation (only the children in the current page are probed for 'infoCourse.json')
+        values = [*head, *nav_children_values(children[page_idx * NAV_PAGE_SIZE : (page_idx + 1) * NAV_PAGE_SIZE]), *tail]
 
         # run the dialog and handle its return value
-        val = radiolist_dialog(title=title, values=values, text=text).run()
+        text = FormattedText([('class:ansired', 'Current Path: %s' % curr_path)]) # pre-parsed fragments (no HTML parsing of the path)
+        if num_pages != 1:
+            text.append(('', ' (Page %d of %d)' % (page_idx + 1, num_pages)))
+        val = run_radiolist_dialog(title=title, values=values, text=text)
         if val is None:
             return None
         elif val is False:
             exit()
         elif val == '.':
             return curr_path
+        elif val == APP_PREV_PAGE_TUPLE[0]:
+            page_idx -= 1
+        elif val == APP_NEXT_PAGE_TUPLE[0]:
+            page_idx += 1
         else:
-            curr_path = val
+            curr_path = val; page_idx = 0
 
 # get the "<NAME>: <TITLE>" title string from an 'infoCourse.json' file's loaded data (or load the data if given a PLCourse)
 def get_course_title(x):
@@ -131,45 +473,72 @@ def get_course_title(x):
 # class to represent a PrairieLearn course
 # https://github.com/PrairieLearn/PrairieLearn/blob/master/apps/prairielearn/src/schemas/schemas/infoCourse.json
 class PLCourse:
+    # attributes of a PLCourse object (no per-object __dict__)
+    __slots__ = ('path', 'info_path')
+
     # initialize this PLCourse object
     def __init__(self, path):
-        if not (path / 'infoCourse.json').is_file():
+        self.path = path; self.info_path = path / 'infoCourse.json'
+        if not self.info_path.is_file():
             error("Invalid PrairieLearn course path: %s" % path)
-        self.path = path
 
     # load and return the data from this course's 'infoCourse.json' file
     def get_info_data(self):
-        with open(self.path / 'infoCourse.json') as f:
-            return jload(f)
+        return load_json_cached(self.info_path)
+
+    # iterate over the paths of course instances in this course
+    def iter_course_instance_paths(self):
+        try:
+            with scandir(self.path / 'courseInstances') as it:
+                ci_paths = [entry.path for entry in it if entry.is_dir()]
+        except FileNotFoundError:
+            return # course has no 'courseInstances' folder
+        for p in ci_paths:
+            if isfile(join(p, 'infoCourseInstance.json')):
+                yield Path(p)
 
     # iterate over course instances in this course
     def iter_course_instances(self):
-        for p in self.path.glob('courseInstances/*/infoCourseInstance.json'):
-            yield PLCourseInstance(p.parent)
+        for p in self.iter_course_instance_paths():
+            yield PLCourseInstance(p, course_path=self.path)
+
+    # iterate over the paths of questions in this course
+    def iter_question_paths(self):
+        for p in iter_folders_containing(self.path / 'questions', 'question.html'):
+            if isfile(join(p, 'info.json')):
+                yield p
 
     # iterate over questions in this course
     def iter_questions(self):
-        for p in (self.path / 'questions').rglob('question.html'):
-            yield PLQuestion(p.parent)
+        for p in self.iter_question_paths():
+            yield PLQuestion(p)
+
+    # drop the cached listings of this course's folders, so the next views re-scan them
+    def refresh(self):
+        with LISTING_LOCK:
+            for cache in (LISTING_CACHE, LISTING_PENDING):
+                for folder in [folder for folder in cache if folder == self.path or self.path in folder.parents]:
+                    del cache[folder]
+
+    # warm the listing/JSON caches used by the course instances and questions views
+    def prefetch(self):
+        load_listing(self.path / 'courseInstances', self.iter_course_instance_paths, 'infoCourseInstance.json')
+        load_listing(self.path / 'questions', self.iter_question_paths, 'info.json', get_rollup_mtime)
 
     # run app for the home view of this PLCourse object
     def app_home(self):
+        run_in_background(self.prefetch)
+        built = None # (info data, dialog title, dialog text) of the last redraw
         while True:
             data = self.get_info_data()
-            order = [('uuid','UUID'), ('comment','Comment'), ('name','Name'), ('title','Title')]
-            text = '- <ansiblue>Path:</ansiblue> %s' % self.path
-            for k, s in order:
-                if k in data:
-                    text += '\n- <ansiblue>%s:</ansiblue> %s' % (s, data[k])
-            text += '\n- <ansiblue>Topics:</ansiblue> %s' % {True:'None', False:', '.join(data['topics'])}[len(data['topics']) == 0]
-            pass # TODO ADD OTHER COURSE INFO
-            values = [
-                ('course_instances', HTML("<ansigreen>View Course Instances</ansigreen>")),
-                ('questions', HTML('<ansigreen>View Questions</ansigreen>')),
-                APP_EXIT_TUPLE,
-            ]
-            text = HTML(text)
-            val = radiolist_dialog(title=get_course_title(data), text=text, values=values).run()
+            if built is None or built[0] is not data:
+                lines = ['- <ansiblue>Path:</ansiblue> %s' % self.path]
+                lines += ['- <ansiblue>%s:</ansiblue> %s' % (s, data[k]) for k, s in COURSE_INFO_ORDER if k in data]
+                lines.append('- <ansiblue>Topics:</ansiblue> %s' % (', '.join(data['topics']) if len(data['topics']) != 0 else 'None'))
+                pass # TODO ADD OTHER COURSE INFO
+                built = (data, get_course_title(data), cached_html('\n'.join(lines)))
+            values = APP_COURSE_HOME_VALUES
+            val = run_radiolist_dialog(title=built[1], text=built[2], values=values)
             if val is None:
                 break
             elif val is False:
@@ -178,6 +547,8 @@ class PLCourse:
                 self.app_course_instances()
             elif val == 'questions':
                 self.app_questions()
+            elif val == 'refresh':
+                self.refresh()
             else:
                 error("Invalid selection: %s" % val)
 
@@ -185,35 +556,35 @@ class PLCourse:
     def app_course_instances(self):
         while True:
             title = "Course Instances - %s" % get_course_title(self)
-            course_instances_data = {ci:ci.get_info_data() for ci in self.iter_course_instances()}
+            course_instances_data = load_listing(self.path / 'courseInstances', self.iter_course_instance_paths, 'infoCourseInstance.json')
             text = '- <ansiblue>Number of Course Instances:</ansiblue> %d' % len(course_instances_data)
-            text = HTML(text)
-            values = sorted(((ci, HTML('<ansigreen>%s</ansigreen> (%s)' % (d['longName'], ci.path.name))) for ci, d in course_instances_data.items()), key=lambda x: x[1].value.lower())
-            values.append(APP_EXIT_TUPLE)
-            val = radiolist_dialog(title=title, text=text, values=values).run()
+            text = cached_html(text)
+            labels = [(p, '<ansigreen>%s</ansigreen> (%s)' % (d['longName'], p.name)) for p, d in course_instances_data.items()]
+            values = sorted_label_values(labels)
+            val = run_radiolist_dialog(title=title, text=text, values=values)
             if val is None:
                 break
             elif val is False:
                 exit()
             else:
-                val.app_home()
+                PLCourseInstance(val, validate=False, course_path=self.path).app_home() # only construct the course instance the user selected
 
     # run app for questions view
     def app_questions(self):
         while True:
             title = "Questions - %s" % get_course_title(self)
-            questions_data = {q:q.get_info_data() for q in self.iter_questions()}
+            questions_data = load_listing(self.path / 'questions', self.iter_question_paths, 'info.json', get_rollup_mtime)
             text = '- <ansiblue>Number of Questions:</ansiblue> %d' % len(questions_data)
-            text = HTML(text)
-            values = sorted(((q, HTML('<ansigreen>%s</ansigreen> (%s)' % (d['title'], q.path.name))) for q, d in questions_data.items()), key=lambda x: x[1].value.lower())
-            values.append(APP_EXIT_TUPLE)
-            val = radiolist_dialog(title=title, text=text, values=values).run()
+            text = cached_html(text)
+            labels = [(p, '<ansigreen>%s</ansigreen> (%s)' % (d['title'], p.name)) for p, d in questions_data.items()]
+            values = sorted_label_values(labels)
+            val = run_radiolist_dialog(title=title, text=text, values=values)
             if val is None:
                 break
             elif val is False:
                 exit()
             else:
-                val.app_home()
+                PLQuestion(val, validate=False).app_home() # only construct the question the user selected
 
 # get the "<NAME>" title string from an 'infoCourseInstance.json' file's loaded data (or load the data if given a PLCourseInstance)
 def get_course_instance_title(x):
@@ -224,48 +595,56 @@ def get_course_instance_title(x):
 # class to represent a PrairieLearn course instance
 # https://github.com/PrairieLearn/PrairieLearn/blob/master/apps/prairielearn/src/schemas/schemas/infoCourseInstance.json
 class PLCourseInstance:
+    # attributes of a PLCourseInstance object (no per-object __dict__)
+    __slots__ = ('path', 'info_path', 'course_path')
+
     # initialize this PLCourseInstance object
-    def __init__(self, path):
-        if not (path / 'infoCourseInstance.json').is_file():
+    # (validate=False skips checking the path, e.g. if the caller just loaded 'infoCourseInstance.json' from a listing of course instances)
+    # (course_path is the root course folder if the caller knows it, which is passed down to this course instance's assessments and zones)
+    def __init__(self, path, validate=True, course_path=None):
+        self.path = path; self.info_path = path / 'infoCourseInstance.json'; self.course_path = course_path
+        if validate and not self.info_path.is_file():
             error("Invalid PrairieLearn course instance path: %s" % path)
-        self.path = path
 
     # iterate over access controls in this course instance
     def iter_access_controls(self):
         data = self.get_info_data()
         for access_data in data['allowAccess']:
-            yield PLAccess(access_data, self.path / 'infoCourseInstance.json')
+            yield PLAccess(access_data, self.info_path)
 
     # iterater over assessments in this course instance
     def iter_assessments(self):
-        for p in (self.path / 'assessments').rglob('infoAssessment.json'):
-            yield PLAssessment(p.parent)
+        for p in self.iter_assessment_paths():
+            yield PLAssessment(p, course_path=self.course_path)
+
+    # iterate over the paths of assessments in this course instance
+    def iter_assessment_paths(self):
+        return iter_folders_containing(self.path / 'assessments', 'infoAssessment.json')
 
     # load and return the data from this course instance's 'infoCourseInstance.json' file
     def get_info_data(self):
-        with open(self.path / 'infoCourseInstance.json') as f:
-            return jload(f)
+        return load_json_cached(self.info_path)
+
+    # warm the listing/JSON caches used by the assessments view
+    def prefetch(self):
+        load_listing(self.path / 'assessments', self.iter_assessment_paths, 'infoAssessment.json', get_rollup_mtime)
 
     # run app for the home view of this PLCourseInstance object
     def app_home(self):
+        run_in_background(self.prefetch)
+        built = None # (info data, dialog title, dialog text) of the last redraw
         while True:
             data = self.get_info_data()
-            order = [('uuid','UUID'), ('comment','Comment'), ('longName','Long Name'), ('hideInEnrollPage','Hide in Enroll Page'), ('timezone','Time Zone')]
-            text = '- <ansiblue>Path:</ansiblue> %s' % self.path
-            for k, s in order:
-                if k in data:
-                    text += '\n- <ansiblue>%s:</ansiblue> %s' % (s, data[k])
-            # TODO MOVE TO SEPARATE "View Access Controls" SELECTION SIMILAR TO HOW ZONES WORK IN ASSESSMENTS
-            # TODO TO DO THE ABOVE, I SHOULD MAKE A PLAccess CLASS OR SOMETHING
-            if 'allowAccess' in data:
-                text += '\n- <ansiblue>Number of Access Controls:</ansiblue> %d' % len(data['allowAccess'])
-            values = [
-                ('access_controls', HTML('<ansigreen>View Access Controls</ansigreen>')),
-                ('assessments', HTML('<ansigreen>View Assessments</ansigreen>')),
-                APP_EXIT_TUPLE,
-            ]
-            text = HTML(text)
-            val = radiolist_dialog(title='Course Instance - %s' % get_course_instance_title(data), text=text, values=values).run()
+            if built is None or built[0] is not data:
+                lines = ['- <ansiblue>Path:</ansiblue> %s' % self.path]
+                lines += ['- <ansiblue>%s:</ansiblue> %s' % (s, data[k]) for k, s in COURSE_INSTANCE_INFO_ORDER if k in data]
+                # TODO MOVE TO SEPARATE "View Access Controls" SELECTION SIMILAR TO HOW ZONES WORK IN ASSESSMENTS
+                # TODO TO DO THE ABOVE, I SHOULD MAKE A PLAccess CLASS OR SOMETHING
+                if 'allowAccess' in data:
+                    lines.append('- <ansiblue>Number of Access Controls:</ansiblue> %d' % len(data['allowAccess']))
+                built = (data, 'Course Instance - %s' % get_course_instance_title(data), cached_html('\n'.join(lines)))
+            values = APP_COURSE_INSTANCE_HOME_VALUES
+            val = run_radiolist_dialog(title=built[1], text=built[2], values=values)
             if val is None:
                 break
             elif val is False:
@@ -287,18 +666,18 @@ class PLCourseInstance:
     def app_assessments(self):
         while True:
             title = "Assessments - %s" % get_course_instance_title(self)
-            assessments_data = {a:a.get_info_data() for a in self.iter_assessments()}
+            assessments_data = load_listing(self.path / 'assessments', self.iter_assessment_paths, 'infoAssessment.json', get_rollup_mtime)
             text = '- <ansiblue>Number of Assessments:</ansiblue> %d' % len(assessments_data)
-            text = HTML(text)
-            values = sorted(((a, HTML('<ansigreen>%s %s</ansigreen> - %s (%s)' % (d['set'], d['number'], d['title'], d['type']))) for a, d in assessments_data.items()), key=lambda x: x[1].value.lower())
-            values.append(APP_EXIT_TUPLE)
-            val = radiolist_dialog(title=title, text=text, values=values).run()
+            text = cached_html(text)
+            labels = [(p, '<ansigreen>%s %s</ansigreen> - %s (%s)' % (d['set'], d['number'], d['title'], d['type'])) for p, d in assessments_data.items()]
+            values = sorted_label_values(labels)
+            val = run_radiolist_dialog(title=title, text=text, values=values)
             if val is None:
                 break
             elif val is False:
                 exit()
             else:
-                val.app_home()
+                PLAssessment(val, validate=False, course_path=self.course_path).app_home() # only construct the assessment the user selected
 
 # get the "<SET> <NUMBER> (<TITLE>)" title string from an 'infoAssessment.json' file's loaded data (or load the data if given a PLAssessment)
 def get_assessment_title(x):
@@ -310,37 +689,36 @@ def get_assessment_title(x):
 # https://github.com/PrairieLearn/PrairieLearn/blob/master/apps/prairielearn/src/schemas/schemas/infoAssessment.json
 class PLAssessment:
     # initialize this PLAssessment object
-    def __init__(self, path):
-        if not (path / 'infoAssessment.json').is_file():
+    # (validate=False skips checking the path, e.g. if the caller just loaded 'infoAssessment.json' from a listing of assessments)
+    # (course_path is the root course folder if the caller knows it, which is passed down to this assessment's zones)
+    def __init__(self, path, validate=True, course_path=None):
+        if validate and not (path / 'infoAssessment.json').is_file():
             error("Invalid PrairieLearn assessment path: %s" % path)
-        self.path = path
+        self.path = path; self.course_path = course_path
 
     # load and return the data from this assessment's 'infoAssessment.json' file
     def get_info_data(self):
-        with open(self.path / 'infoAssessment.json') as f:
-            return jload(f)
+        return load_json_cached(self.path / 'infoAssessment.json')
 
-    # iterate over zones in this assessment
-    def iter_zones(self):
-        for zone_data in self.get_info_data()['zones']:
-            yield PLZone(zone_data, self.path / 'infoAssessment.json')
+    # iterate over zones in this assessment (data is this assessment's already-loaded 'infoAssessment.json' data if the caller has it)
+    def iter_zones(self, data=None):
+        if data is None:
+            data = self.get_info_data()
+        for zone_data in data['zones']:
+            yield PLZone(zone_data, self.path / 'infoAssessment.json', course_path=self.course_path)
 
     # run app for home view of this PLAssessment object
     def app_home(self):
+        built = None # (info data, dialog title, dialog text) of the last redraw
         while True:
             data = self.get_info_data()
-            order = [('uuid','UUID'), ('comment','Comment'), ('type','Type'), ('set','Set'), ('number','Number'), ('title','Title'), ('shuffleQuestions','Shuffle Questions'), ('allowRealTimeGrading','Allow Real-Time Grading')]
-            text = '- <ansiblue>Path:</ansiblue> %s' % self.path
-            for k, s in order:
-                if k in data:
-                    text += '\n- <ansiblue>%s:</ansiblue> %s' % (s, data[k])
-            pass # TODO ADD OTHER ASSESSMENT INFO
-            values = [
-                ('zones', HTML('<ansigreen>View Zones</ansigreen>')),
-                APP_EXIT_TUPLE,
-            ]
-            text = HTML(text)
-            val = radiolist_dialog(title='Assessment - %s' % get_assessment_title(data), text=text, values=values).run()
+            if built is None or built[0] is not data:
+                lines = ['- <ansiblue>Path:</ansiblue> %s' % self.path]
+                lines += ['- <ansiblue>%s:</ansiblue> %s' % (s, data[k]) for k, s in ASSESSMENT_INFO_ORDER if k in data]
+                pass # TODO ADD OTHER ASSESSMENT INFO
+                built = (data, 'Assessment - %s' % get_assessment_title(data), cached_html('\n'.join(lines)))
+            values = APP_ASSESSMENT_HOME_VALUES
+            val = run_radiolist_dialog(title=built[1], text=built[2], values=values)
             if val is None:
                 break
             elif val is False:
@@ -355,10 +733,10 @@ class PLAssessment:
         while True:
             data = self.get_info_data()
             text = '- <ansiblue>Number of Zones:</ansiblue> %d' % len(data['zones'])
-            text = HTML(text)
-            values = [(z, HTML('<ansigreen>%s</ansigreen>' % z.get_data()['title'])) for z in self.iter_zones()]
+            text = cached_html(text)
+            values = [(z, colored_html('ansigreen', z.data['title'])) for z in self.iter_zones(data)]
             values.append(APP_EXIT_TUPLE)
-            val = radiolist_dialog(title="Zones - %s" % get_assessment_title(self), text=text, values=values).run()
+            val = run_radiolist_dialog(title="Zones - %s" % get_assessment_title(self), text=text, values=values)
             if val is None:
                 break
             elif val is False:
@@ -381,11 +759,11 @@ class PLAccess:
         while True:
             text = '- <ansiblue>Path:</ansiblue> %s' % self.path
             pass # TODO ADD OTHER ACCESS INFO
-            text = HTML(text)
+            text = cached_html(text)
             valies = [
                 APP_EXIT_TUPLE,
             ]
-            val = radiolist_dialog(title=title, text=text, values=values).run()
+            val = run_radiolist_dialog(title=title, text=text, values=values)
             if val is None:
                 break
             elif val is False:
@@ -396,8 +774,8 @@ class PLAccess:
 # class to represent a PrairieLearn assessment zone
 class PLZone:
     # initialize this PLZone object
-    def __init__(self, data, path):
-        self.data = data; self.path = path
+    def __init__(self, data, path, course_path=None):
+        self.data = data; self.path = path; self.course_path = course_path # root course folder (found on first use if not given)
 
     # get the data defining this zone
     def get_data(self):
@@ -405,7 +783,9 @@ class PLZone:
 
     # iterate over questions in this zone
     def iter_questions(self):
-        questions_path = find_course_path(self.path) / 'questions'
+        if self.course_path is None:
+            self.course_path = find_course_path(self.path)
+        questions_path = self.course_path / 'questions'
         if not questions_path.is_dir():
             error("Questions path not found: %s" % questions_path)
         for q_data in self.data['questions']:
@@ -415,14 +795,11 @@ class PLZone:
     def app_home(self):
         while True:
             title = 'Zone - %s' % self.data['title']
-            text = '- <ansiblue>Path:</ansiblue> %s' % self.path
+            lines = ['- <ansiblue>Path:</ansiblue> %s' % self.path]
             pass # TODO ADD OTHER ZONE INFO
-            text = HTML(text)
-            values = [
-                ('questions', HTML('<ansigreen>View Questions</ansigreen>')),
-                APP_EXIT_TUPLE,
-            ]
-            val = radiolist_dialog(title=title, text=text, values=values).run()
+            text = cached_html('\n'.join(lines))
+            values = APP_ZONE_HOME_VALUES
+            val = run_radiolist_dialog(title=title, text=text, values=values)
             if val is None:
                 break
             elif val is False:
@@ -434,14 +811,15 @@ class PLZone:
 
     # run app for questions view
     def app_questions(self):
+        questions = list(self.iter_questions()) # the zone's questions are fixed by its data, so only look them up once
         while True:
             title = "Questions - %s" % self.data['title']
-            questions_data = {q:q.get_info_data() for q in self.iter_questions()}
+            questions_data = load_parallel(PLQuestion.get_info_data, questions, lambda q: peek_json_cached(q.path / 'info.json'))
             text = '- <ansiblue>Number of Questions:</ansiblue> %d' % len(questions_data)
-            text = HTML(text)
-            values = sorted(((q, HTML('<ansigreen>%s</ansigreen> (%s)' % (d['title'], q.path.name))) for q, d in questions_data.items()), key=lambda x: x[1].value.lower())
-            values.append(APP_EXIT_TUPLE)
-            val = radiolist_dialog(title=title, text=text, values=values).run()
+            text = cached_html(text)
+            labels = [(q, '<ansigreen>%s</ansigreen> (%s)' % (d['title'], q.path.name)) for q, d in questions_data.items()]
+            values = sorted_label_values(labels)
+            val = run_radiolist_dialog(title=title, text=text, values=values)
             if val is None:
                 break
             elif val is False:
@@ -450,42 +828,37 @@ class PLZone:
                 val.app_home()
 
 # get the "<NAME>" title string from an 'info.json' file's loaded data (or load the data if given a PLQuestion)
-def get_question_title(info_data):
-    if isinstance(info_data, PLQuestion):
-        with open(info_data.path / 'info.json') as f:
-            info_data = jload(f)
-    return info_data['title']
+def get_question_title(x):
+    if isinstance(x, PLQuestion):
+        x = x.get_info_data()
+    return x['title']
 
 # class to represent a PrairieLearn question
 # https://github.com/PrairieLearn/PrairieLearn/blob/master/apps/prairielearn/src/schemas/schemas/infoQuestion.json
 class PLQuestion:
     # initialize this PLQuestion object
-    def __init__(self, path):
-        if not (path / 'question.html').is_file() or not (path / 'info.json').is_file():
+    # (validate=False skips checking the path, e.g. if the caller just loaded 'info.json' from a listing of question folders)
+    def __init__(self, path, validate=True):
+        if validate and (not (path / 'question.html').is_file() or not (path / 'info.json').is_file()):
             error("Invalid PrairieLearn question path: %s" % path)
         self.path = path
 
     # load and return the data from this question's 'info.json' file
     def get_info_data(self):
-        with open(self.path / 'info.json') as f:
-            return jload(f)
+        return load_json_cached(self.path / 'info.json')
 
     # run app for home view of this PLQuestion object
     def app_home(self):
+        built = None # (info data, dialog title, dialog text) of the last redraw
         while True:
-            with open(self.path / 'info.json') as f:
-                data = jload(f)
-            order = [('uuid','UUID'), ('comment','Comment'), ('title','Title')]
-            text = '- <ansiblue>Path:</ansiblue> %s' % self.path
-            for k, s in order:
-                if k in data:
-                    text += '\n- <ansiblue>%s:</ansiblue> %s' % (s, data[k])
-            pass # TODO ADD OTHER COURSE INSTANCE INFO
-            values = [
-                APP_EXIT_TUPLE,
-            ]
-            text = HTML(text)
-            val = radiolist_dialog(title='Question - %s' % get_question_title(data), text=text, values=values).run()
+            data = self.get_info_data()
+            if built is None or built[0] is not data:
+                lines = ['- <ansiblue>Path:</ansiblue> %s' % self.path]
+                lines += ['- <ansiblue>%s:</ansiblue> %s' % (s, data[k]) for k, s in QUESTION_INFO_ORDER if k in data]
+                pass # TODO ADD OTHER COURSE INSTANCE INFO
+                built = (data, 'Question - %s' % get_question_title(data), cached_html('\n'.join(lines)))
+            values = APP_QUESTION_HOME_VALUES
+            val = run_radiolist_dialog(title=built[1], text=built[2], values=values)
             if val is None:
                 break
             elif val is False:
@@ -506,6 +879,7 @@ def main():
         pl_course_dir = None # will use app to find PrairieLearn Course later
 
     # run app
+    import_prompt_toolkit()
     if pl_course_dir is None:
         app_welcome(); pl_course_dir = app_nav_course()
     pl_course = PLCourse(pl_course_dir)